@@ -23,8 +23,8 @@ from pathlib import Path
 from typing import Optional
 
 # Third Party
-import fiona
 import pandas as pd
+import pyogrio
 
 # Third party imports
 from caf.toolkit import BaseConfig
@@ -62,14 +62,17 @@ class ZoneSystemInfo(BaseConfig):
 
     @model_validator(mode="before")
     def _id_col_in_file(cls, values):
-        with fiona.collection(values["shapefile"]) as source:
-            schema = source.schema
-            if values["id_col"] not in schema["properties"].keys():
-                raise ValueError(
-                    f"The id_col provided, {values['id_col']}, does not appear"
-                    f" in the given shapefile. Please choose from:"
-                    f"{schema['properties'].keys()}."
-                )
+        # only the layer metadata is read, features aren't loaded
+        try:
+            fields = pyogrio.read_info(values["shapefile"])["fields"].tolist()
+        except pyogrio.errors.DataSourceError as exc:
+            raise ValueError(f"Unable to read shapefile {values['shapefile']}: {exc}") from exc
+        if values["id_col"] not in fields:
+            raise ValueError(
+                f"The id_col provided, {values['id_col']}, does not appear"
+                f" in the given shapefile. Please choose from:"
+                f"{fields}."
+            )
         return values
 
 
@@ -223,7 +226,10 @@ class ZoningTranslationInputs(BaseConfig):
     cache_path: Path
         File path to a cache of existing translations. This defaults to
         a location on a network drive, and it is best to keep it there,
-        but it's more important for weighted translations.
+        but it's more important for weighted translations. A cached
+        translation is reused, instead of being recalculated, if it was
+        produced with the same parameters, by the same version of
+        caf.space, and none of the input files have changed since.
     method: str, optional
         The name of the method used for weighting (e.g. pop or emp).
         This can be anything, but must be included as the tool checks if
@@ -254,6 +260,14 @@ class ZoningTranslationInputs(BaseConfig):
     run_date: str, datetime.datetime.now().strftime("%d_%m_%y")
         When the tool is being run. This is always generated
         automatically and shouldn't be included in the config yaml file.
+    use_cache: bool, default True
+        Select whether a matching translation in the cache should be
+        reused. Set to False to force the translation to be recalculated;
+        the cache is still updated with the new translation.
+    version: str, optional
+        Version of caf.space used to produce a cached translation. This is
+        set automatically when a translation is saved to the cache and
+        shouldn't be included in the config yaml file.
     """
 
     zone_1: TransZoneSystemInfo
@@ -267,6 +281,8 @@ class ZoningTranslationInputs(BaseConfig):
     point_handling: bool = False
     point_tolerance: float = 1
     run_date: str = datetime.datetime.now().strftime("%d_%m_%y")
+    use_cache: bool = True
+    version: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Make directories if they don't exist."""
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 "User interface for caf.space."
 # Built-Ins
+import collections
+import concurrent.futures
 import logging
 import sys
 import tkinter as tk
+import traceback
 from functools import partial
 from pathlib import Path
-from tkinter import filedialog, ttk
-from typing import Optional
+from tkinter import filedialog, messagebox, ttk
+from typing import Callable, Optional
 
 # Local Imports
 from caf.space import inputs, zone_translation
@@ -21,38 +24,90 @@ from caf.space import inputs, zone_translation
 SHAPE_FILEFILTER = (("Shapefiles", "*.shp"), ("All files", "*.*"))
 CSV_FILEFILTER = (("CSV", "*.csv"), ("All files", "*.*"))
 GEO_PREFIXES = ["shp", "gpkg", "geojson", "json"]
+# Milliseconds between writing queued console output to the widget
+CONSOLE_FLUSH_MS = 50
+# Milliseconds between checks on whether a translation run has finished
+RUN_POLL_MS = 100
+# Milliseconds to wait after the method name last changed before toggling lower zoning
+LOWER_DEBOUNCE_MS = 150
+# Dialog used by FileWidget for each browse type
+FILE_DIALOGS = {
+    "open": filedialog.askopenfilename,
+    "save": filedialog.asksaveasfilename,
+    "directory": filedialog.askdirectory,
+}
 
 # # # CLASSES # # #
 # pylint: disable=too-many-ancestors, too-many-instance-attributes, unused-argument
 
 
-class RedirectStdOut:  # pylint: disable=too-few-public-methods
-    """Class to redirect stdout to `ScolledText` widget."""
+class RedirectStdOut:
+    """Class to redirect stdout, stderr and logging to a `tk.Text` widget.
 
-    def __init__(self, text_widget):
-        self.output = text_widget.text
+    Writes are queued and added to the widget in a single insert every
+    `CONSOLE_FLUSH_MS`, so frequent writes don't hold up the UI and writes
+    from other threads never call Tk directly.
+
+    Parameters
+    ----------
+    text_widget : tk.Text
+        Widget to write to, expected to have the "n", "warning", "error"
+        and "debug" tags configured.
+    """
+
+    def __init__(self, text_widget: tk.Text):
+        self.output = text_widget
+        self._pending: collections.deque[str] = collections.deque()
+        self._after_id: Optional[str] = self.output.after(
+            CONSOLE_FLUSH_MS, self._write_pending
+        )
 
     def write(self, text: str):
-        """Write given `text` to widget.
+        """Queue given `text` to be written to widget.
 
         Parameters
         ----------
         text : str
             Message to write to widget.
         """
-        # Check what tag to add
-        tag = None
-        for i in ("warning", "error", "debug"):
-            if f"[{i}]" in text.lower():
-                tag = i
-        self.output.configure(state="normal")
-        self.output.insert("end", text, tag)
-        self.output.configure(state="disabled")
+        self._pending.append(text)
+
+    def flush(self):
+        """Do nothing, queued text is written to the widget periodically."""
+
+    def close(self):
+        """Stop writing queued text to the widget, e.g. when it's being destroyed."""
+        if self._after_id is not None:
+            self.output.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _write_pending(self):
+        """Write all queued text to the widget, then schedule the next write."""
+        chunks = []
+        while self._pending:
+            text = self._pending.popleft()
+            # Check what tag to add
+            tags = ("n",)
+            for i in ("warning", "error", "debug"):
+                if f"[{i}]" in text.lower():
+                    tags = ("n", i)
+            chunks.extend((text, tags))
+        if chunks:
+            self.output.configure(state="normal")
+            self.output.insert("end", *chunks)
+            self.output.see("end")
+            self.output.configure(state="disabled")
+        self._after_id = self.output.after(CONSOLE_FLUSH_MS, self._write_pending)
 
 
 class FileWidget(ttk.Frame):
     """Tkinter widget for an entry box to select a file."""
 
+    # Last directory browsed to for each browse type, and for any type, shared by
+    # all widgets
+    _last_dir: dict[str, str] = {}
+    _last_any_dir: Optional[str] = None
+
     def __init__(
         self,
         parent,
@@ -83,6 +138,11 @@ class FileWidget(ttk.Frame):
         """
         super().__init__(parent)
         self.browse_type = str(browse).lower()
+        if self.browse_type not in FILE_DIALOGS:
+            raise ValueError(f"Invalid browse type: {browse}")
+        self._ask = FILE_DIALOGS[self.browse_type]
+        if self.browse_type == "open":
+            self._ask = partial(self._ask, filetypes=file_filter)
 
         # Create label if needed as either entry or label widget
         self.label = ttk.Label(self, text=label, width=widths[1])
@@ -103,16 +163,28 @@ class FileWidget(ttk.Frame):
         self.path.pack(side="left", fill="x", expand=True)
         self.button.pack(side="right", fill="x", padx=5)
 
+    def _folder(self, path: str) -> str:
+        """Folder containing `path`, or `path` itself for directory widgets."""
+        if self.browse_type == "directory":
+            return str(Path(path))
+        return str(Path(path).parent)
+
     def browse(self):
-        """Open filedialog for selecting a file."""
-        if self.browse_type == "open":
-            path = filedialog.askopenfilename(filetypes=self.file_filter)
-        elif self.browse_type == "save":
-            path = filedialog.asksaveasfilename()
-        elif self.browse_type == "directory":
-            path = filedialog.askdirectory()
-        else:
-            raise ValueError("Invalid browse type")
+        """Open filedialog for selecting a file.
+
+        The dialog starts in the last directory browsed to with the same browse
+        type, otherwise the folder of the current entry or the last directory
+        browsed to by any file widget.
+        """
+        initial_dir = self._last_dir.get(self.browse_type)
+        if initial_dir is None and self.get():
+            initial_dir = self._folder(self.get())
+        if initial_dir is None:
+            initial_dir = FileWidget._last_any_dir
+        path = self._ask(parent=self.winfo_toplevel(), initialdir=initial_dir)
+        if path:
+            FileWidget._last_dir[self.browse_type] = self._folder(path)
+            FileWidget._last_any_dir = self._folder(path)
         self.set(path)
         return path
 
@@ -130,7 +202,7 @@ class FileWidget(ttk.Frame):
         label: str, optional
             Value to set the label entry box to.
         """
-        self.path.delete(0, len(self.path.get()))
+        self.path.delete(0, "end")
         self.path.insert(0, value)
 
     def disable(self):
@@ -191,7 +263,7 @@ class LabelledTextEntry(ttk.Frame):
         """
         Set method for class. Sets to value.
         """
-        self.text.delete(0, len(self.text.get()))
+        self.text.delete(0, "end")
         self.text.insert(0, value)
 
     def disable(self):
@@ -215,7 +287,8 @@ class NumberScroller(ttk.Frame):
     ----------
     parent: tkinter container widget
             Parent container for storing the widget.
-    scroll_range: The range of numbers the scroller will scroll between.
+    scroll_range: The range of whole numbers the scroller will scroll between, only
+        whole numbers up to the end of the range can be typed in.
     label (str): Label text.
     default_value (int): The value the scroller will start on.
     label_width (int): The width of the label.
@@ -225,16 +298,23 @@ class NumberScroller(ttk.Frame):
         super().__init__(parent)
         self.link_var = tk.IntVar(value=default_value)
         self.label = ttk.Label(self, text=label, width=label_width)
+        self._max_value = int(scroll_range[-1])
         self.scroller = ttk.Spinbox(
             self,
-            from_=scroll_range[0],
-            to=scroll_range[-1],
+            from_=int(scroll_range[0]),
+            to=self._max_value,
             width=10,
             textvariable=self.link_var,
+            validate="key",
+            validatecommand=(self.register(self._valid_entry), "%P"),
         )
         self.label.pack(side="left", fill="x", padx=5)
         self.scroller.pack(side="right", fill="x", padx=5)
 
+    def _valid_entry(self, value: str) -> bool:
+        """Only allow whole numbers up to the top of the range to be typed."""
+        return value == "" or (value.isdecimal() and int(value) <= self._max_value)
+
     def get(self):
         """
         Get method.
@@ -305,6 +385,9 @@ class ZoneFrame(ttk.LabelFrame):
             widths=(30, 15),
             file_filter=SHAPE_FILEFILTER,
         )
+        # Last model returned by get and the field values it was built from
+        self._model_key: Optional[tuple] = None
+        self._model: Optional[inputs.TransZoneSystemInfo] = None
 
         self.shapefile.grid(column=0, row=0, columnspan=3, sticky="ew", pady=5)
         self.name.grid(column=0, row=1, columnspan=3, sticky="ew", pady=5)
@@ -335,21 +418,28 @@ class ZoneFrame(ttk.LabelFrame):
 
         Returns
         -------
-        Instance of TransZoneSystemInfo class with parameters read from UI.
-        """
-        if self.point_shapefile.get() == "":
-            zone = inputs.TransZoneSystemInfo(
-                shapefile=self.shape_var.get(),
-                name=self.name_var.get(),
-                id_col=self.id_col_var.get(),
-            )
+        Instance of TransZoneSystemInfo class with parameters read from UI,
+        this is only rebuilt (and validated) when the fields have changed.
+        """
+        key = (
+            self.shape_var.get(),
+            self.name_var.get(),
+            self.id_col_var.get(),
+            self.point_shapefile.get(),
+        )
+        if key == self._model_key:
+            return self._model
+        shapefile, name, id_col, point_shapefile = key
+        if point_shapefile == "":
+            zone = inputs.TransZoneSystemInfo(shapefile=shapefile, name=name, id_col=id_col)
         else:
             zone = inputs.TransZoneSystemInfo(
-                shapefile=self.shape_var.get(),
-                name=self.name_var.get(),
-                id_col=self.id_col_var.get(),
-                point_shapefile=self.point_shapefile.get(),
+                shapefile=shapefile,
+                name=name,
+                id_col=id_col,
+                point_shapefile=point_shapefile,
             )
+        self._model_key, self._model = key, zone
         return zone
 
     def validate(self):
@@ -410,6 +500,9 @@ class LowerZoneFrame(ttk.LabelFrame):
             label_width=30,
             text_width=10,
         )
+        # Last model returned by get and the field values it was built from
+        self._model_key: Optional[tuple] = None
+        self._model: Optional[inputs.LowerZoneSystemInfo] = None
 
         self.shapefile.grid(column=0, row=0, columnspan=3, sticky="ew", pady=5)
         self.name.grid(column=0, row=1, columnspan=3, sticky="ew", pady=5)
@@ -448,17 +541,24 @@ class LowerZoneFrame(ttk.LabelFrame):
         Get method for class.
         Returns
         -------
-        Instance of LowerZoneSystemInfo class with parameters read from UI.
-        """
-        lower_zone = inputs.LowerZoneSystemInfo(
-            shapefile=self.shapefile.get(),
-            name=self.name.get(),
-            id_col=self.id_col.get(),
-            weight_data=self.weight_data.get(),
-            data_col=self.data_col.get(),
-            weight_id_col=self.weight_id_col.get(),
-            weight_data_year=int(self.weight_data_year.get()),
-        )
+        Instance of LowerZoneSystemInfo class with parameters read from UI,
+        this is only rebuilt (and validated) when the fields have changed.
+        """
+        fields = {
+            "shapefile": self.shapefile.get(),
+            "name": self.name.get(),
+            "id_col": self.id_col.get(),
+            "weight_data": self.weight_data.get(),
+            "data_col": self.data_col.get(),
+            "weight_id_col": self.weight_id_col.get(),
+            "weight_data_year": self.weight_data_year.get(),
+        }
+        key = tuple(fields.values())
+        if key == self._model_key:
+            return self._model
+        fields["weight_data_year"] = int(fields["weight_data_year"])
+        lower_zone = inputs.LowerZoneSystemInfo(**fields)
+        self._model_key, self._model = key, lower_zone
         return lower_zone
 
     def validate(self):
@@ -517,6 +617,8 @@ class ParametersFrame(ttk.LabelFrame):
             label_width=15,
             text_width=10,
         )
+        self._lower_after_id: Optional[str] = None
+        self._lower_enabled = False
         self.method_var.trace_add("write", self.activate_lower)
         self.lower = LowerZoneFrame(self)
         self.lower.disable()
@@ -532,7 +634,7 @@ class ParametersFrame(ttk.LabelFrame):
         )
         self.point_tolerance = NumberScroller(
             self,
-            scroll_range=(1, 1e06),
+            scroll_range=(1, 1_000_000),
             label="Area threshold for point zones",
             default_value=1,
             label_width=30,
@@ -594,8 +696,22 @@ class ParametersFrame(ttk.LabelFrame):
     def activate_lower(self, *args):
         """
         Toggles the lower frame based on whether there is any text in method.
-        """
-        if len(self.method_var.get()) > 0:
+
+        This is called on every change to method, so the toggle is only
+        applied once it hasn't changed for `LOWER_DEBOUNCE_MS`.
+        """
+        if self._lower_after_id is not None:
+            self.after_cancel(self._lower_after_id)
+        self._lower_after_id = self.after(LOWER_DEBOUNCE_MS, self._apply_lower_state)
+
+    def _apply_lower_state(self):
+        """Enable or disable the lower frame, only if its state has changed."""
+        self._lower_after_id = None
+        enabled = len(self.method_var.get()) > 0
+        if enabled == self._lower_enabled:
+            return
+        self._lower_enabled = enabled
+        if enabled:
             self.lower.enable()
         else:
             self.lower.disable()
@@ -638,6 +754,11 @@ class UiTab(ttk.Frame):
 
     def __init__(self, master=None):
         super().__init__(master)
+        # Translations run in a worker thread so the UI stays responsive
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._run: Optional[concurrent.futures.Future] = None
+        self._check_after_id: Optional[str] = None
+        self.bind("<Destroy>", self._shutdown)
         self.main_params = ParametersFrame(self)
         self.main_params.zone_1.shape_var.trace_add("write", self.activate_spatial)
         self.main_params.zone_1.shape_var.trace_add("write", self.activate_weighted)
@@ -669,7 +790,11 @@ class UiTab(ttk.Frame):
         """
         Toggles the run spatial button depending on provided parameters.
         """
-        if self.main_params.zone_2.validate() and self.main_params.zone_1.validate():
+        if (
+            not self._running()
+            and self.main_params.zone_2.validate()
+            and self.main_params.zone_1.validate()
+        ):
             self.spatial_button.config(state="normal")
         else:
             self.spatial_button.config(state="disabled")
@@ -679,7 +804,8 @@ class UiTab(ttk.Frame):
         Toggles the run weighted button depending on provided parameters.
         """
         if (
-            self.main_params.zone_1.validate()
+            not self._running()
+            and self.main_params.zone_1.validate()
             and self.main_params.zone_2.validate()
             and self.main_params.lower.validate()
         ):
@@ -687,57 +813,78 @@ class UiTab(ttk.Frame):
         else:
             self.weighted_button.config(state="disabled")
 
+    def _running(self) -> bool:
+        """Whether a translation is currently running."""
+        return self._run is not None and not self._run.done()
+
+    def _start(self, run: Callable[[], None]):
+        """Run `run` in the worker thread, disabling both run buttons until it's done."""
+        self.weighted_button.config(state="disabled")
+        self.spatial_button.config(state="disabled")
+        self._run = self._executor.submit(run)
+        self._check_after_id = self.after(RUN_POLL_MS, self._check_run)
+
+    def _check_run(self):
+        """Poll the running translation, reporting any error once it finishes."""
+        if self._running():
+            self._check_after_id = self.after(RUN_POLL_MS, self._check_run)
+            return
+        self._check_after_id = None
+        self.activate_spatial()
+        self.activate_weighted()
+        error = self._run.exception()
+        if error is not None:
+            traceback.print_exception(type(error), error, error.__traceback__)
+            messagebox.showerror("Translation failed", str(error), parent=self)
+
+    def _shutdown(self, event: tk.Event):
+        """Stop polling and shut down the worker thread when the tab is destroyed."""
+        if event.widget is not self:
+            return
+        if self._check_after_id is not None:
+            self.after_cancel(self._check_after_id)
+            self._check_after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def run_weighted(self):
         """
         Function controlled by run weighted button.
 
         Gets parameters from UI inputs, passes them to a config class, and uses
         them to generate a weighted translation, which is saved to the output
-        path.
+        path. The translation runs in a worker thread.
         """
         params, output_path = self.main_params.get()
-        trans = zone_translation.ZoneTranslation(params)
-        trans.weighted_translation().to_csv(
-            output_path / f"{params.zone_1.name}_{params.zone_2.name}_{params.method}.csv",
-            index=False,
+        out_file = (
+            output_path / f"{params.zone_1.name}_{params.zone_2.name}_{params.method}.csv"
         )
 
+        def run():
+            trans = zone_translation.ZoneTranslation(params)
+            trans.weighted_translation().to_csv(out_file, index=False)
+
+        self._start(run)
+
     def run_spatial(self):
         """
         Function controlled by run spatial button.
 
         Gets parameters from UI inputs, passes them to a config class, and uses
         them to generate a spatial translation, which is saved to the output
-        path.
+        path. The translation runs in a worker thread.
         """
         params, output_path = self.main_params.get()
-        trans = zone_translation.ZoneTranslation(params)
-        trans.spatial_translation().to_csv(
-            output_path / f"{params.zone_1.name}_{params.zone_2.name}_spatial.csv",
-            index=False,
-        )
+        out_file = output_path / f"{params.zone_1.name}_{params.zone_2.name}_spatial.csv"
 
+        def run():
+            trans = zone_translation.ZoneTranslation(params)
+            trans.spatial_translation().to_csv(out_file, index=False)
 
-class ConsoleFrame(ttk.Frame):
-    """Frame containing the console."""
+        self._start(run)
 
-    class StdoutRedirector:
-        """
-        Class for redirecting.
-        """
 
-        def __init__(self, text_widget):
-            self.text_space = text_widget
-            self.text_space.tag_configure("n", font=("Calibri", 12))
-
-        def write(self, string):
-            """
-            Turns on write, writes output then disables.
-            """
-            self.text_space.config(state="normal")
-            self.text_space.insert("end", string, "n")
-            self.text_space.see("end")
-            self.text_space.config(state="disabled")
+class ConsoleFrame(ttk.Frame):
+    """Frame containing the console."""
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -753,18 +900,28 @@ class ConsoleFrame(ttk.Frame):
             wrap="none",
         )
 
-        # Change stdout
-        sys.stdout = self.StdoutRedirector(self.text)
-        sys.stderr = self.StdoutRedirector(self.text)
+        # Change stdout, one redirect is shared so output stays in order
+        self.redirect = RedirectStdOut(self.text)
+        self._stdout, self._stderr = sys.stdout, sys.stderr
+        sys.stdout = self.redirect
+        sys.stderr = self.redirect
+        self.text.bind("<Destroy>", self._restore_stdout)
 
         # Pack widgets
         yscroll.pack(side="right", fill="y")
         xscroll.pack(side="bottom", fill="x")
+        self.text.tag_configure("n", font=("Calibri", 12))
         self.text.tag_configure("warning", foreground="orange")
         self.text.tag_configure("error", foreground="red")
         self.text.tag_configure("debug", foreground="gray")
         self.text.pack(side="left", fill="both", expand=True)
 
+    def _restore_stdout(self, event: tk.Event):
+        """Stop the redirect and restore stdout and stderr when the console is destroyed."""
+        self.redirect.close()
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+
 
 class NotebookApp(tk.Tk):
     """
@@ -790,11 +947,12 @@ class NotebookApp(tk.Tk):
         self.console_text.pack(fill="both", expand=True)
         self.notebook.add(console_tab, text="Console Output")
         self.mainloop()
+        self._logger.removeHandler(self.console_handler)
 
     def _redirect_logging(self):
         """Add new handler to root logger which outputs to `self.terminal`."""
         self._logger = logging.getLogger(__package__)
-        self.console_handler = logging.StreamHandler(stream=RedirectStdOut(self.console_text))
+        self.console_handler = logging.StreamHandler(stream=self.console_text.redirect)
         fmt = logging.Formatter("[{levelname}] {message}", style="{")
         self.console_handler.setFormatter(fmt)
         self.console_handler.setLevel(logging.INFO)
@@ -7,6 +7,7 @@ from pathlib import Path
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 from scipy.spatial import cKDTree
 
 # pylint: disable=import-error,wrong-import-position
@@ -14,6 +15,8 @@ from scipy.spatial import cKDTree
 # pylint: enable=import-error,wrong-import-position
 
 # # # CONSTANTS # # #
+# Integer geometry type returned by `shapely.get_type_id` for points
+POINT_TYPE_ID = 0
 
 # # # CLASSES # # #
 
@@ -42,19 +45,53 @@ def generate_points(point_folder: Path, points_name: str, zones_path: Path, join
     points = pd.read_csv(point_folder / points_name)
     main_zones = gpd.read_file(zones_path)
     point_polys = main_zones.merge(points, on=join_col, how="right")
-    for i in point_polys.index:
-        update = main_zones.loc[
-            point_polys.loc[i, "geometry"].buffer(1).overlaps(main_zones.geometry), join_col
-        ].to_list()
-        main_zones.loc[main_zones[join_col] == point_polys.loc[i, join_col], join_col] = (
-            update[0]
-        )
+    first_overlap = _first_overlaps(point_polys, main_zones)
+    # relabel on a plain array, later points see labels updated by earlier ones
+    zone_ids = main_zones[join_col].to_numpy(copy=True)
+    for i, point_id in enumerate(point_polys[join_col]):
+        zone_ids[zone_ids == point_id] = zone_ids[first_overlap[i]]
+    main_zones[join_col] = zone_ids
     dissolved = main_zones.dissolve(by=join_col)
     point_polys.geometry = point_polys.centroid
     point_polys.to_file(point_folder / "point_zones.shp")
     dissolved.to_file(point_folder / "zones_no_points.shp")
 
 
+def _first_overlaps(point_polys: gpd.GeoDataFrame, zones: gpd.GeoDataFrame) -> dict:
+    """
+    Find the first zone, in `zones` order, overlapping each buffered point polygon.
+
+    Returns a dict of positions in `point_polys` to positions in `zones`, points
+    with no overlapping zones are left out.
+    """
+    # find the zones overlapping each buffered point polygon with one query on the
+    # (prepared) spatial index, rather than testing every zone for every point
+    point_pos, zone_pos = zones.sindex.query(
+        point_polys.geometry.buffer(1), predicate="overlaps"
+    )
+    # keep the first overlapping zone for each point
+    order = np.lexsort((zone_pos, point_pos))
+    hit_points, first = np.unique(point_pos[order], return_index=True)
+    return dict(zip(hit_points, zone_pos[order][first]))
+
+
+def _point_coordinates(gdf: gpd.GeoDataFrame, name: str) -> np.ndarray:
+    """
+    Get the coordinates of a point geodataframe, one row per feature.
+
+    Raises a ValueError if any geometries are missing, empty or not single
+    points, as these would stop the coordinates lining up with the rows.
+    """
+    geoms = gdf.geometry.values
+    invalid = (shapely.get_type_id(geoms) != POINT_TYPE_ID) | shapely.is_empty(geoms)
+    if invalid.any():
+        raise ValueError(
+            f"{name} points must all be non-empty single points, "
+            f"{invalid.sum()} features are missing, empty or another geometry type."
+        )
+    return shapely.get_coordinates(geoms)
+
+
 def find_point_matches(
     gda: gpd.GeoDataFrame,
     gdb: gpd.GeoDataFrame,
@@ -64,6 +101,8 @@ def find_point_matches(
     id_col_2: str,
     name_1: str,
     name_2: str,
+    workers: int = -1,
+    leafsize: int = 16,
 ):
     """
     Find corresponding point features between two geodataframe.
@@ -80,21 +119,30 @@ def find_point_matches(
     id_col_2: id_col of gdb
     name_1: name of gda
     name_2: name of gdb
+    workers: Number of workers used to query the KD-tree, -1 uses all CPUs.
+    leafsize: Number of points at which the KD-tree switches to brute force.
+
     Returns
     -------
     gdB with a column for corresponding points in gdA, and the distance between them.
     """
-    gda = gda.rename(columns={id_col_1: f"{name_1}_id"})
-    gdb = gdb.rename(columns={id_col_2: f"{name_2}_id"})
-    aarray = np.array(list(gda.geometry.apply(lambda x: (x.x, x.y))))
-    barray = np.array(list(gdb.geometry.apply(lambda x: (x.x, x.y))))
-    btree = cKDTree(barray)
-    dist, idx = btree.query(aarray, k=1)
-    gdb_nearest = gdb.iloc[idx].drop(columns="geometry").reset_index(drop=True)
-    gdf = pd.concat(
-        [gda.reset_index(drop=True), gdb_nearest, pd.Series(dist, name="dist")], axis=1
+    aarray = _point_coordinates(gda, name_1)
+    barray = _point_coordinates(gdb, name_2)
+    # the tree is built once and queried once, so skip the median splits and node
+    # compaction which only pay off for repeated queries
+    btree = cKDTree(barray, leafsize=leafsize, balanced_tree=False, compact_nodes=False)
+    # neighbours beyond max_dist aren't searched for, unmatched points are
+    # returned with an infinite distance and an index of len(gdb)
+    dist, idx = btree.query(aarray, k=1, distance_upper_bound=max_dist, workers=workers)
+    found = dist < max_dist
+    # gather ids by position, `.array` keeps extension dtypes
+    return pd.DataFrame(
+        {
+            f"{name_1}_id": gda[id_col_1].array[found],
+            f"{name_2}_id": gdb[id_col_2].array[idx[found]],
+            "dist": dist[found],
+        }
     )
-    return gdf.loc[gdf["dist"] < max_dist, [f"{name_1}_id", f"{name_2}_id", "dist"]]
 
 
 def points_update(
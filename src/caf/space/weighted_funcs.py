@@ -16,9 +16,10 @@ from typing import Optional
 # pylint: disable=import-error
 import geopandas as gpd
 import pandas as pd
+import shapely
 
 # Local Imports
-from caf.space import inputs
+from caf.space import inputs, utils
 
 # pylint: enable=import-error
 
@@ -43,12 +44,18 @@ def _weighted_lower(
     -------
     A lower zoning system with weighting joined to it.
     """
-    lower_zone = gpd.read_file(lower_zoning.shapefile)
+    # only read the columns used, the data column comes from the shapefile
+    # when there's no separate weight data
+    columns = [lower_zoning.id_col]
+    if lower_zoning.weight_data is None:
+        columns.append(lower_zoning.data_col)
+    lower_zone = gpd.read_file(lower_zoning.shapefile, columns=columns)
     lower_zone.set_index(lower_zoning.id_col, inplace=True)
     if lower_zoning.weight_data is not None:
         weighting = pd.read_csv(
             lower_zoning.weight_data,
             index_col=lower_zoning.weight_id_col,
+            usecols=[lower_zoning.weight_id_col, lower_zoning.data_col],
         )
         weighted = lower_zone.join(weighting)
     else:
@@ -69,7 +76,6 @@ def _point_handling(
     zone: gpd.GeoDataFrame,
     zone_id: str,
     lower: gpd.GeoDataFrame,
-    lower_id: str,
     tolerance: float,
 ) -> gpd.GeoDataFrame:
     """
@@ -83,7 +89,6 @@ def _point_handling(
     zone: The zone gdf for point zones to be altered within.
     zone_id: The name of the id column in the zone gdf.
     lower: The lower gdf to be used for point zone adjustment.
-    lower_id: The name of the id column in the lower gdf.
     tolerance: The area below which zones will be classified as point zones
     and handled accordingly.
 
@@ -94,16 +99,18 @@ def _point_handling(
     the geometry changed. Where there are no zones smaller than threshold the
     function simply returns zone unchanged.
     """
-    zone.loc[zone.geometry.geometry.type == "Point", "geometry"] = zone.loc[
-        zone.geometry.geometry.type == "Point", "geometry"
-    ].buffer(0.1)
+    is_point = shapely.get_type_id(zone.geometry.values) == utils.POINT_TYPE_ID
+    zone.loc[is_point, "geometry"] = zone.loc[is_point, "geometry"].buffer(0.1)
     points = zone[zone.area < tolerance]
     points = points.set_crs("EPSG:27700")
     if len(points) > 0:
-        lower.reset_index(inplace=True)
-        joined = gpd.sjoin(points, lower, how="left", predicate="within")
-        new = pd.merge(lower.reset_index(), joined, how="inner", on=lower_id)
-        new = gpd.GeoDataFrame(data=new[zone_id], geometry=new["geometry_x"])
+        # positions of each point and the lower zone it lies within
+        point_idx, lower_idx = lower.sindex.query(points.geometry, predicate="within")
+        new = gpd.GeoDataFrame(
+            data={zone_id: points[zone_id].to_numpy()[point_idx]},
+            geometry=lower.geometry.to_numpy()[lower_idx],
+            crs=lower.crs,
+        )
         overlay = zone.overlay(new, how="symmetric_difference", keep_geom_type=False)
         overlay.rename(columns={f"{zone_id}_1": zone_id}, inplace=True)
         out = overlay[~overlay[zone_id].isna()]
@@ -144,22 +151,21 @@ def _create_tiles(
             zone_1_points.rename(columns={zone_1.id_col: f"{zone_1.name}_id"}, inplace=True)
             zone_1_gdf = pd.concat([zone_1_gdf, zone_1_points])
         zone_1_gdf = _point_handling(
-            zone_1_gdf, f"{zone_1.name}_id", weighting, lower_zoning.id_col, point_tolerance
+            zone_1_gdf, f"{zone_1.name}_id", weighting, point_tolerance
         )
         if zone_2_points is not None:
             zone_2_points = zone_2_points.loc[:, [zone_2.id_col, "geometry"]]
             zone_2_points.rename(columns={zone_2.id_col: f"{zone_2.name}_id"}, inplace=True)
             zone_2_gdf = pd.concat([zone_2_gdf, zone_2_points])
         zone_2_gdf = _point_handling(
-            zone_2_gdf, f"{zone_2.name}_id", weighting, lower_zoning.id_col, point_tolerance
+            zone_2_gdf, f"{zone_2.name}_id", weighting, point_tolerance
         )
     tiles = reduce(
         lambda x, y: gpd.overlay(x, y, keep_geom_type=True),
         [zone_1_gdf, zone_2_gdf, weighting],
     )
-    tiles["overlay_area"] = tiles.area
-    tiles["prop"] = tiles.overlay_area / tiles.lower_area
-    tiles[lower_zoning.data_col] *= tiles.prop
+    # scale weights by the proportion of each lower zone within the tile
+    tiles[lower_zoning.data_col] *= tiles.area / tiles["lower_area"]
     return tiles[
         [
             f"{zone_1.name}_id",
@@ -169,24 +175,6 @@ def _create_tiles(
     ]
 
 
-def return_totals(frame: pd.DataFrame, id_col: str, data_col: str) -> pd.DataFrame:
-    """
-    Group df by id_col and sums, keeping data_col.
-
-    Parameters
-    ----------
-    frame: A dataframe.
-    id_col: Column to group by.
-    data_col: Column to keep
-
-    Returns
-    -------
-    Grouped and summed df
-    """
-    totals = frame.groupby(id_col)[data_col].sum(numeric_only=True)
-    return totals
-
-
 def get_weighted_translation(
     zones: dict,
     zone_1: inputs.TransZoneSystemInfo,
@@ -228,19 +216,18 @@ def get_weighted_translation(
         zone_1_points=zone_1_points,
         zone_2_points=zone_2_points,
     )
-    # produce total weights by each respective zone system.
-    totals_1 = return_totals(tiles, f"{zone_1.name}_id", lower_zoning.data_col).to_frame()
-    totals_2 = return_totals(tiles, f"{zone_2.name}_id", lower_zoning.data_col).to_frame()
     # get values of overlaps between zone systems by grouping by both
-    # zone systems and summing.
-    overlap = (
-        tiles.groupby([f"{zone_1.name}_id", f"{zone_2.name}_id"])
-        .sum()
-        .loc[:, lower_zoning.data_col]
-        .to_frame()
-    )
-    return overlap.join(totals_1, rsuffix="_1").join(
-        totals_2, lsuffix="_overlap", rsuffix="_2"
+    # zone systems and summing, only the weight column is aggregated.
+    data_col = lower_zoning.data_col
+    overlap = tiles.groupby([f"{zone_1.name}_id", f"{zone_2.name}_id"])[data_col].sum()
+    # produce total weights by each respective zone system, aligned to the
+    # overlap index so no further joins are needed.
+    return pd.DataFrame(
+        {
+            f"{data_col}_overlap": overlap,
+            f"{data_col}_1": overlap.groupby(level=0).transform("sum"),
+            f"{data_col}_2": overlap.groupby(level=1).transform("sum"),
+        }
     )
 
 
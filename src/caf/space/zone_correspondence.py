@@ -46,53 +46,23 @@ def read_zone_shapefiles(
     for translation. zone_1.name and zone_1.name contain 'Zone'
     (GeoDataFrame) and 'ID_col'(str)
     """
-    # create geodataframes from zone shapefiles
-    z_1 = gpd.read_file(zone_1.shapefile)
-    z_2 = gpd.read_file(zone_2.shapefile)
-
-    z_1 = z_1.dropna(axis=1, how="all")
-    z_2 = z_2.dropna(axis=1, how="all")
-
-    LOG.info(
-        "Count of %s zones: %s",
-        zone_2.name,
-        z_2.iloc[:, 0].count(),
-    )
-    LOG.info(
-        "Count of %s zones: %s",
-        zone_1.name,
-        z_1.iloc[:, 0].count(),
-    )
-
-    z_1["area"] = z_1.area
-    z_1 = z_1.dropna(subset=["area"])
-    z_2["area"] = z_2.area
-    z_2 = z_2.dropna(subset=["area"])
-
-    zones = {
-        zone_1.name: {
-            "Zone": z_1.drop("area", axis=1),
-            "ID_col": zone_1.id_col,
-        },
-        zone_2.name: {
-            "Zone": z_2.drop("area", axis=1),
-            "ID_col": zone_2.id_col,
-        },
-    }
-
-    for name, zone in zones.items():
-        zone["Zone"].rename(
-            columns={zone["ID_col"]: f"{name}_id"},
-            inplace=True,
-        )
-
-        if not zone["Zone"].crs:
-            warnings.warn(f"Zone {name} has no CRS, setting crs to EPSG:27700.")
-            zone["Zone"].set_crs("EPSG:27700")
-        elif zone["Zone"].crs != "EPSG:27700":
-            zone["Zone"].geometry = zone["Zone"].geometry.to_crs("EPSG:27700")
-
-        zone["Zone"][f"{name}_area"] = zone["Zone"].area
+    zones = {}
+    for zone in (zone_1, zone_2):
+        # create geodataframe from zone shapefile, only the id column is used
+        gdf = gpd.read_file(zone.shapefile, columns=[zone.id_col])
+        LOG.info("Count of %s zones: %s", zone.name, gdf[zone.id_col].count())
+
+        # drop features without a geometry
+        gdf = gdf.loc[gdf.geometry.notna()].rename(columns={zone.id_col: f"{zone.name}_id"})
+
+        if not gdf.crs:
+            warnings.warn(f"Zone {zone.name} has no CRS, setting crs to EPSG:27700.")
+            gdf = gdf.set_crs("EPSG:27700")
+        elif gdf.crs != "EPSG:27700":
+            gdf = gdf.to_crs("EPSG:27700")
+
+        gdf[f"{zone.name}_area"] = gdf.area
+        zones[zone.name] = {"Zone": gdf, "ID_col": zone.id_col}
     return zones
 
 
@@ -121,10 +91,11 @@ def spatial_zone_correspondence(
     GeoDataFrame with 4 columns: zone 1 IDs, zone 2 IDs, zone 1 to zone
     2 adjustment factor and zone 2 to zone 1 adjustment factor.
     """
-    # create geodataframe for intersection of zones
+    # create geodataframe for intersection of zones, only carrying the
+    # columns used below through the overlay
     zone_overlay = gpd.overlay(
-        zones[zone_1.name]["Zone"],
-        zones[zone_2.name]["Zone"],
+        zones[zone_1.name]["Zone"][[f"{zone_1.name}_id", f"{zone_1.name}_area", "geometry"]],
+        zones[zone_2.name]["Zone"][[f"{zone_2.name}_id", f"{zone_2.name}_area", "geometry"]],
         how="intersection",
         keep_geom_type=False,
     ).reset_index()
@@ -227,13 +198,15 @@ def rounding_correction(
     from_col = f"{from_zone_name}_id"
     factor_col = f"{from_zone_name}_to_{to_zone_name}"
 
-    counts = zone_corr.groupby(from_col).size()
+    # Split rows once into one to one and one to many lookups, rows with a
+    # missing from id get a NaN size so are left out of both and untouched
+    sizes = zone_corr.groupby(from_col)[from_col].transform("size").to_numpy()
+    multi = sizes > 1
 
     # Set factor to 1 for one to one lookups
-    zone_corr.loc[zone_corr[from_col].isin(counts[counts == 1].index), factor_col] = 1.0
+    zone_corr.loc[sizes == 1, factor_col] = 1.0
 
     # calculate missing adjustments for those that don't have a one to one mapping
-    rest_to_round = zone_corr.loc[zone_corr[from_col].isin(counts[counts > 1].index)]
     factor_totals, differences = calculate_differences(zone_corr)
 
     LOG.info(
@@ -248,23 +221,10 @@ def rounding_correction(
     )
 
     # Calculate factor to adjust the zone correspondence by
-    differences.loc[:, "correction"] = 1 + (differences["diff"] / factor_totals)
+    correction = 1 + (differences["diff"] / factor_totals)
 
     # Multiply zone corresondence by the correction factor
-    rest_to_round = rest_to_round.merge(
-        differences["correction"],
-        how="left",
-        left_on=from_col,
-        right_on=differences.index,
-    ).set_index(rest_to_round.index)
-
-    rest_to_round.loc[:, factor_col] = (
-        rest_to_round.loc[:, factor_col] * rest_to_round.loc[:, "correction"]
-    )
-
-    rest_to_round = rest_to_round.drop(labels="correction", axis=1)
-
-    zone_corr.loc[zone_corr[from_col].isin(rest_to_round[from_col]), :] = rest_to_round
+    zone_corr.loc[multi, factor_col] *= zone_corr.loc[multi, from_col].map(correction)
 
     # Recalculate differences after adjustment
     factor_totals, differences = calculate_differences(zone_corr)
@@ -350,16 +310,12 @@ def round_zone_correspondence(
         zone_names[0],
     )
 
-    zone_corr_rounded_both_ways = zone_corr_rounded_both_ways.merge(
-        zone_corr_rounded[f"{zone_names[1]}_to_{zone_names[0]}"],
-        how="left",
-        left_on=zone_corr_rounded_both_ways.index,
-        right_on=zone_corr_rounded.index,
-    )
-
-    zone_corr_rounded_both_ways = zone_corr_rounded_both_ways.drop(labels="key_0", axis=1)
+    # both directions come from the same rows so share an index, the column
+    # is aligned on it directly rather than merged and the key dropped
+    factor_col = f"{zone_names[1]}_to_{zone_names[0]}"
+    zone_corr_rounded_both_ways[factor_col] = zone_corr_rounded[factor_col]
 
-    return zone_corr_rounded_both_ways
+    return zone_corr_rounded_both_ways.reset_index(drop=True)
 
 
 def missing_zones_check(
@@ -9,18 +9,23 @@ ZoneTranslationInputs class in 'inputs'.
 import logging
 import warnings
 from pathlib import Path
+from typing import Optional
 
 # Third Party
 import geopandas as gpd
 import pandas as pd
+import pyogrio
 
 # Local Imports
-from caf.space import inputs, utils, weighted_funcs, zone_correspondence
+from caf.space import __version__, inputs, utils, weighted_funcs, zone_correspondence
 
 ##### CONSTANTS #####
 LOG = logging.getLogger("SPACE")
 # logging.basicConfig(format="%(asctime)s [%(name)-20.20s] [%(levelname)-8.8s]  %(message)s")
 logging.captureWarnings(True)
+# Files storing a shapefile's attributes, index, projection and encoding,
+# which can change without the '.shp' itself being modified
+SHAPEFILE_SIDECARS = (".dbf", ".shx", ".prj", ".cpg")
 
 
 ##### CLASSES #####
@@ -91,18 +96,20 @@ class ZoneTranslation:
         spatial_translation: pd.DataFrame
             Dataframe containing spatial zone translation between zone 1 and zone 2.
         """
+        out_path = self.cache_path / f"{self.names[0]}_{self.names[1]}"
+        out_name = f"{self.names[0]}_to_{self.names[1]}_spatial"
+        cached = self._read_cache(out_path, out_name)
+        if cached is not None:
+            return cached
         zones = zone_correspondence.read_zone_shapefiles(self.zone_1, self.zone_2)
         spatial_correspondence = zone_correspondence.spatial_zone_correspondence(
             zones, self.zone_1, self.zone_2
         )
         final_zone_corr = self._slithers_and_rounding(spatial_correspondence)
         # Save correspondence output
-        out_path = self.cache_path / f"{self.names[0]}_{self.names[1]}"
         out_path.mkdir(exist_ok=True, parents=False)
         self._post_processing(zones, final_zone_corr, out_path)
-        out_name = f"{self.names[0]}_to_{self.names[1]}_spatial"
-        final_zone_corr.to_csv(out_path / f"{out_name}.csv", index=False)
-        self.params.save_yaml(out_path / f"{out_name}.yml")
+        self._write_cache(final_zone_corr, out_path, out_name)
         return final_zone_corr
 
     def weighted_translation(self) -> pd.DataFrame:
@@ -129,13 +136,22 @@ class ZoneTranslation:
             raise ValueError("A method must be provided to perform a weighted translation.")
         if self.params.lower_zoning is False:
             raise ValueError("Lower zoning data is required for a weighted translations.")
+        out_path = self.cache_path / f"{self.names[0]}_{self.names[1]}"
+        out_name = f"{self.names[0]}_to_{self.names[1]}_{self.method}_{self.lower_zoning.weight_data_year}"
+        cached = self._read_cache(out_path, out_name)
+        if cached is not None:
+            return cached
         zones = zone_correspondence.read_zone_shapefiles(self.zone_1, self.zone_2)
         points_1 = None
         points_2 = None
         if self.zone_1.point_shapefile:
             if self.zone_2.point_shapefile:
-                points_1 = gpd.read_file(self.zone_1.point_shapefile)
-                points_2 = gpd.read_file(self.zone_2.point_shapefile)
+                points_1 = gpd.read_file(
+                    self.zone_1.point_shapefile, columns=[self.zone_1.id_col]
+                )
+                points_2 = gpd.read_file(
+                    self.zone_2.point_shapefile, columns=[self.zone_2.id_col]
+                )
                 if len(points_1) > len(points_2):
                     matches = utils.find_point_matches(
                         points_1,
@@ -163,9 +179,11 @@ class ZoneTranslation:
                     points_2, matches, self.zone_2.id_col, f"{self.zone_2.name}_id"
                 )
             else:
-                points_1 = gpd.read_file(self.zone_1.point_shapefile)
+                points_1 = gpd.read_file(
+                    self.zone_1.point_shapefile, columns=[self.zone_1.id_col]
+                )
         elif self.zone_2.point_shapefile:
-            points_2 = gpd.read_file(self.zone_2.point_shapefile)
+            points_2 = gpd.read_file(self.zone_2.point_shapefile, columns=[self.zone_2.id_col])
         weighted_translation = weighted_funcs.final_weighted(
             zones,
             self.zone_1,
@@ -186,17 +204,146 @@ class ZoneTranslation:
         weighted_translation.reset_index(inplace=True)
 
         weighted_translation = self._slithers_and_rounding(weighted_translation)
-        out_path = self.cache_path / f"{self.names[0]}_{self.names[1]}"
         out_path.mkdir(exist_ok=True, parents=False)
         if "matches" in locals():
             matches[fill_columns] = 1
             weighted_translation = pd.concat([weighted_translation, matches])
         self._post_processing(zones, weighted_translation, out_path)
-        out_name = f"{self.names[0]}_to_{self.names[1]}_{self.method}_{self.lower_zoning.weight_data_year}"
-        weighted_translation.to_csv(out_path / f"{out_name}.csv", index=False)
-        self.params.save_yaml(out_path / f"{out_name}.yml")
+        self._write_cache(weighted_translation, out_path, out_name)
         return weighted_translation
 
+    def _read_cache(self, out_path: Path, out_name: str) -> Optional[pd.DataFrame]:
+        """
+        Read a previously saved translation from the cache, if valid.
+
+        The split factor checks are rerun on the cached translation, but the
+        missing zone checks aren't as they need the zone shapefiles.
+
+        Parameters
+        ----------
+        out_path: Folder in the cache the translation would be saved to.
+        out_name: Name of the translation file, without a suffix. The
+        translation and its config are expected in out_path with '.csv'
+        and '.yml' suffixes respectively.
+
+        Returns
+        -------
+        The cached translation, or None if there isn't a valid one.
+        """
+        csv_file = out_path / f"{out_name}.csv"
+        if not self._cache_valid(csv_file, out_path / f"{out_name}.yml"):
+            return None
+
+        # Read ids with the same dtypes as the shapefiles, so e.g. zero padded
+        # string ids aren't turned into integers
+        id_dtypes = {}
+        for zone in (self.zone_1, self.zone_2):
+            info = pyogrio.read_info(zone.shapefile)
+            dtype = dict(zip(info["fields"], info["dtypes"]))[zone.id_col]
+            id_dtypes[f"{zone.name}_id"] = str if dtype == "object" else dtype
+
+        self.logger.info("Using cached translation found here: %s", csv_file)
+        cached = pd.read_csv(csv_file, dtype=id_dtypes, float_precision="round_trip")
+        self.logger.info(
+            "Missing zone checks aren't rerun for cached translations, the last "
+            "missing zones log for these zone systems can be found here: %s",
+            out_path / "missing_zones_log.xlsx",
+        )
+        self._split_factor_summary(cached)
+        return cached
+
+    def _cache_valid(self, csv_file: Path, yml_file: Path) -> bool:
+        """
+        Check whether a cached translation can be used.
+
+        A cached translation is only used if caching is enabled, the config
+        saved alongside it was produced by this version of caf.space and
+        matches the current parameters (ignoring the run date), and none of
+        the input files, including shapefile sidecar files, have been
+        modified since it was written.
+
+        Parameters
+        ----------
+        csv_file: Path to the cached translation.
+        yml_file: Path to the config saved alongside the cached translation.
+
+        Returns
+        -------
+        True if the cached translation is valid, otherwise False.
+        """
+        if not (self.params.use_cache and csv_file.is_file() and yml_file.is_file()):
+            return False
+        try:
+            cached_params = inputs.ZoningTranslationInputs.load_yaml(yml_file)
+        except (ValueError, OSError) as exc:
+            self.logger.info("Ignoring cached translation %s: %s", csv_file, exc)
+            return False
+        exclude = {"run_date", "use_cache", "version"}
+        same_params = cached_params.model_dump(exclude=exclude) == self.params.model_dump(
+            exclude=exclude
+        )
+        if cached_params.version != __version__ or not same_params:
+            self.logger.info(
+                "Ignoring cached translation %s produced with different parameters "
+                "or by a different version of caf.space (%s)",
+                csv_file,
+                cached_params.version,
+            )
+            return False
+
+        cache_time = csv_file.stat().st_mtime
+        changed = [file for file in self._input_files() if file.stat().st_mtime > cache_time]
+        if changed:
+            self.logger.info(
+                "Inputs have changed since %s was cached: %s",
+                csv_file,
+                ", ".join(str(file) for file in changed),
+            )
+            return False
+        return True
+
+    def _input_files(self) -> list[Path]:
+        """
+        List all input files used for the translation.
+
+        Includes any sidecar files found alongside input shapefiles, as a
+        shapefile's attributes and projection are stored in these.
+        """
+        files = [
+            self.zone_1.shapefile,
+            self.zone_1.point_shapefile,
+            self.zone_2.shapefile,
+            self.zone_2.point_shapefile,
+        ]
+        if self.params.lower_zoning is not None:
+            files += [self.lower_zoning.shapefile, self.lower_zoning.weight_data]
+
+        input_files = []
+        for file in files:
+            if file is None:
+                continue
+            file = Path(file)
+            input_files.append(file)
+            if file.suffix.lower() == ".shp":
+                sidecars = (file.with_suffix(suffix) for suffix in SHAPEFILE_SIDECARS)
+                input_files += [sidecar for sidecar in sidecars if sidecar.is_file()]
+        return input_files
+
+    def _write_cache(self, translation: pd.DataFrame, out_path: Path, out_name: str):
+        """
+        Save a translation to the cache, alongside the config used to produce it.
+
+        Parameters
+        ----------
+        translation: The zone translation to save.
+        out_path: Folder in the cache to save the translation in.
+        out_name: Name of the translation file, without a suffix.
+        """
+        translation.to_csv(out_path / f"{out_name}.csv", index=False)
+        self.params.model_copy(update={"version": __version__}).save_yaml(
+            out_path / f"{out_name}.yml"
+        )
+
     def _slithers_and_rounding(self, translation: pd.DataFrame) -> pd.DataFrame:
         """
         Process slithers and rounding parameters.
@@ -284,6 +431,16 @@ class ZoneTranslation:
             "List of missing zones can be found in log file found here: %s",
             log_file,
         )
+        self._split_factor_summary(zone_translation)
+
+    def _split_factor_summary(self, zone_translation: pd.DataFrame):
+        """
+        Log whether the split factors for each zone system add up to 1.
+
+        Parameters
+        ----------
+        zone_translation: A dataframe containing a weighted or spatial translation.
+        """
         column_list = list(zone_translation.columns)
 
         summary_table_1 = zone_translation.groupby(column_list[0])[column_list[2]].sum()
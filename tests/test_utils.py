@@ -0,0 +1,56 @@
+"""
+Module for testing the utils module
+"""
+
+# Third Party
+import geopandas as gpd
+import pytest
+from shapely.geometry import MultiPoint, Point
+
+# Local Imports
+from caf.space import utils
+
+
+@pytest.fixture(name="points_a", scope="module")
+def fixture_points_a() -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        {"a_id": ["A", "B", "C"]}, geometry=[Point(0, 0), Point(10, 10), Point(50, 50)]
+    )
+
+
+@pytest.fixture(name="points_b", scope="module")
+def fixture_points_b() -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame({"b_id": ["X", "Y"]}, geometry=[Point(10, 11), Point(0, 1)])
+
+
+class TestFindPointMatches:
+    """
+    Class for testing the find_point_matches function in utils
+    """
+
+    def _matches(self, gda, gdb):
+        return utils.find_point_matches(
+            gda, gdb, 5, id_col_1="a_id", id_col_2="b_id", name_1="a", name_2="b"
+        )
+
+    def test_matches(self, points_a, points_b):
+        """
+        Test points are matched to their nearest point within the max distance.
+        """
+        matches = self._matches(points_a, points_b)
+        assert matches.set_index("a_id")["b_id"].to_dict() == {"A": "Y", "B": "X"}
+
+    @pytest.mark.parametrize(
+        "geometry",
+        [MultiPoint([(0, 1), (20, 20)]), Point(), None],
+        ids=["multipoint", "empty", "missing"],
+    )
+    def test_invalid_points(self, points_a, points_b, geometry):
+        """
+        Test multipart, empty and missing geometries raise an error rather than
+        misaligning the matched ids.
+        """
+        invalid = points_b.copy()
+        invalid.loc[1, "geometry"] = geometry
+        with pytest.raises(ValueError, match="non-empty single points"):
+            self._matches(points_a, invalid)
@@ -72,7 +72,6 @@ def fixture_no_points(weighted_config):
         zone=zone,
         zone_id=weighted_config.zone_2.id_col,
         lower=lower,
-        lower_id=weighted_config.lower_zoning.id_col,
         tolerance=weighted_config.point_tolerance,
     )
 
@@ -89,7 +88,6 @@ def fixture_points(point_zones, point_shapefile_2, weighted_config):
         zone=zone,
         zone_id=weighted_config.zone_2.id_col,
         lower=lower,
-        lower_id=weighted_config.lower_zoning.id_col,
         tolerance=2,
     )
     return adjusted
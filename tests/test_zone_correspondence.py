@@ -0,0 +1,33 @@
+"""
+Module for testing the zone_correspondence module
+"""
+
+# Third Party
+import numpy as np
+import pandas as pd
+
+# Local Imports
+from caf.space import zone_correspondence
+
+
+class TestRoundingCorrection:
+    """
+    Class for testing the rounding_correction function in zone_correspondence
+    """
+
+    def test_missing_ids(self):
+        """
+        Test rows with a missing from zone id are left untouched, while one to
+        one rows are set to 1 and one to many rows are adjusted to sum to 1.
+        """
+        corr = pd.DataFrame(
+            {
+                "a_id": ["A", "B", "B", np.nan],
+                "b_id": ["W", "X", "Y", "Z"],
+                "a_to_b": [0.9, 0.3, 0.6, 0.5],
+            }
+        )
+        rounded = zone_correspondence.rounding_correction(corr.copy(), "a", "b")
+        assert rounded["a_to_b"].iloc[0] == 1
+        assert rounded["a_to_b"].iloc[1:3].sum() == 1
+        assert rounded["a_to_b"].iloc[3] == 0.5
@@ -3,6 +3,9 @@
 """
 
 # Built-Ins
+import logging
+import os
+import shutil
 from copy import deepcopy
 from math import sqrt
 from pathlib import Path
@@ -265,3 +268,58 @@ class TestZoneTranslation:
         df_2 = expected.groupby(["zone_1_id", "zone_2_id"]).sum()
         df_2.sort_index(inplace=True)
         pd.testing.assert_frame_equal(df_1, df_2)
+
+    def test_cached(self, spatial_config, tmp_path, caplog):
+        """
+        Test that rerunning a translation with the same inputs reads it from
+        the cache rather than recalculating it, and that the cached translation
+        is identical to the original, including zero padded string ids.
+        """
+        config = deepcopy(spatial_config)
+        config.cache_path = tmp_path
+        for zone in (config.zone_1, config.zone_2):
+            gdf = gpd.read_file(zone.shapefile)
+            gdf[zone.id_col] = [f"{i:03d}" for i in range(0, 10 * len(gdf), 10)]
+            zone.shapefile = tmp_path / f"{zone.name}_padded.shp"
+            gdf.to_file(zone.shapefile)
+        first = zone_translation.ZoneTranslation(config).spatial_translation()
+        with caplog.at_level(logging.INFO, logger="SPACE"):
+            cached = zone_translation.ZoneTranslation(config).spatial_translation()
+        assert "Using cached translation" in caplog.text
+        assert "Split factors add up to 1" in caplog.text
+        assert cached["zone_1_id"].str.startswith("0").all()
+        pd.testing.assert_frame_equal(cached, first)
+
+    def test_cache_dbf_changed(self, spatial_config, tmp_path, caplog):
+        """
+        Test that changing only a shapefile's attributes, stored in its '.dbf',
+        means the translation is recalculated rather than read from the cache.
+        """
+        config = deepcopy(spatial_config)
+        config.cache_path = tmp_path
+        gdf = gpd.read_file(config.zone_1.shapefile)
+        config.zone_1.shapefile = tmp_path / "zone_1.shp"
+        gdf.to_file(config.zone_1.shapefile)
+        zone_translation.ZoneTranslation(config).spatial_translation()
+
+        gdf[config.zone_1.id_col] = [f"NEW{i}" for i in range(len(gdf))]
+        gdf.to_file(tmp_path / "zone_1_new.shp")
+        dbf = config.zone_1.shapefile.with_suffix(".dbf")
+        shutil.copyfile(tmp_path / "zone_1_new.dbf", dbf)
+        # Make sure the '.dbf' is newer than the cache, whatever the file system's precision
+        mtime = dbf.stat().st_mtime + 10
+        os.utime(dbf, (mtime, mtime))
+
+        with caplog.at_level(logging.INFO, logger="SPACE"):
+            trans = zone_translation.ZoneTranslation(config).spatial_translation()
+        assert "Using cached translation" not in caplog.text
+        assert trans["zone_1_id"].str.startswith("NEW").all()
+
+    def test_cache_disabled(self, spatial_config, spatial_trans, caplog):
+        """Test that setting use_cache to False recalculates a cached translation."""
+        config = deepcopy(spatial_config)
+        config.use_cache = False
+        with caplog.at_level(logging.INFO, logger="SPACE"):
+            trans = zone_translation.ZoneTranslation(config).spatial_translation()
+        assert "Using cached translation" not in caplog.text
+        pd.testing.assert_frame_equal(trans, spatial_trans)